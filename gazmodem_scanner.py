@@ -13,10 +13,16 @@ import socket
 import struct
 import time
 import threading
+import select
 import csv
 import queue
 from typing import Dict, Tuple, Optional, List, Set, Any, Union
 
+try:
+    from binascii import crc_hqx
+except ImportError:
+    crc_hqx = None
+
 # --- GLOBAL CONFIGURATION ---
 
 ## @var DEFAULT_IP
@@ -27,6 +33,10 @@ DEFAULT_IP: str = "192.168.1.38"
 #  @brief Default TCP port for the connection (Standard is 8899).
 DEFAULT_PORT: int = 8899
 
+## @var SOCKET_BUFFER_SIZE
+#  @brief Kernel receive/send buffer size (bytes) requested for the converter socket.
+SOCKET_BUFFER_SIZE: int = 262144
+
 ## @var MY_SA
 #  @brief Source Address used by the scanner.
 #  @details 0 usually represents the Touch Panel (Master).
@@ -42,29 +52,151 @@ SNIFF_DURATION: int = 30
 #  @details If 100 consecutive parameters return no data, the scanner moves to the next device.
 MAX_EMPTY_STREAK: int = 100
 
+## @var UI_BATCH_SIZE
+#  @brief Maximum number of results inserted in the table per UI refresh (every 100ms).
+UI_BATCH_SIZE: int = 500
+
+## @var _HIGHLIGHT_NEEDLES
+#  @brief Value substrings flagging a probable temperature candidate (row highlighted in green).
+_HIGHLIGHT_NEEDLES: Tuple[str, str] = ("15.7", "21.2")
+
+## @var _TAGS_HI
+#  @brief Treeview tags of a highlighted row.
+_TAGS_HI: Tuple[str, ...] = ("highlight",)
+
+## @var _TAGS_NO
+#  @brief Treeview tags of a regular row.
+_TAGS_NO: Tuple[str, ...] = ()
+
+## @var MAX_FRAME_LEN
+#  @brief Largest LEN field accepted by the frame parser.
+#  @details Larger values are treated as a false Start Byte, so a corrupted header cannot stall the parser.
+MAX_FRAME_LEN: int = 4096
+
+## @var SCAN_WINDOW
+#  @brief Number of read requests kept in flight during the active scan.
+#  @details Requests are sent back-to-back and the responses are matched by their echoed index.
+SCAN_WINDOW: int = 8
+
+## @var RESPONSE_TIMEOUT
+#  @brief Maximum silence (seconds) tolerated while waiting for the responses of a window.
+RESPONSE_TIMEOUT: float = 0.2
+
 # --- PROTOCOL DEFINITIONS ---
 
 ## @var TYPE_DEFS
 #  @brief Dictionary mapping Protocol Data Types to Python structures.
-#  @details Structure: { ID: (Name, Size_Bytes, Struct_Format, Is_Float) }
-TYPE_DEFS: Dict[int, Tuple[str, int, Optional[str], bool]] = {
+#  @details Structure: { ID: (Name, Size_Bytes, Precompiled_Struct, Is_Float) }
+#           The struct.Struct objects are built once so decoding does not re-parse format strings.
+TYPE_DEFS: Dict[int, Tuple[str, int, Optional[struct.Struct], bool]] = {
     0:  ("None", 0, None, False),
-    1:  ("SHORT INT", 1, "<b", False),
-    2:  ("INT", 2, "<h", False),
-    3:  ("LONG INT", 4, "<i", False),
-    4:  ("BYTE", 1, "<B", False),
-    5:  ("WORD", 2, "<H", False),
-    6:  ("DWORD", 4, "<I", False),
-    7:  ("SHORT REAL", 4, "<f", True),
+    1:  ("SHORT INT", 1, struct.Struct("<b"), False),
+    2:  ("INT", 2, struct.Struct("<h"), False),
+    3:  ("LONG INT", 4, struct.Struct("<i"), False),
+    4:  ("BYTE", 1, struct.Struct("<B"), False),
+    5:  ("WORD", 2, struct.Struct("<H"), False),
+    6:  ("DWORD", 4, struct.Struct("<I"), False),
+    7:  ("SHORT REAL", 4, struct.Struct("<f"), True),
     8:  ("None", 0, None, False),
-    9:  ("LONG REAL", 8, "<d", True),
-    10: ("BOOLEAN", 1, "<B", False),
-    11: ("BCD", 1, "<B", False),
-    12: ("STRING", 0, "s", False),
-    13: ("INT 64", 8, "<q", False),
-    14: ("UINT 64", 8, "<Q", False)
+    9:  ("LONG REAL", 8, struct.Struct("<d"), True),
+    10: ("BOOLEAN", 1, struct.Struct("<B"), False),
+    11: ("BCD", 1, struct.Struct("<B"), False),
+    12: ("STRING", 0, None, False),
+    13: ("INT 64", 8, struct.Struct("<q"), False),
+    14: ("UINT 64", 8, struct.Struct("<Q"), False)
 }
 
+## @var _TYPE_TABLE
+#  @brief TYPE_DEFS flattened into a tuple indexed by Type ID (0-15, the 4 lower bits of the Info byte).
+#  @details Unknown IDs map to ("UNK", 0, None, False).
+_TYPE_TABLE: Tuple[Tuple[str, int, Optional[struct.Struct], bool], ...] = tuple(
+    TYPE_DEFS.get(i, ("UNK", 0, None, False)) for i in range(16))
+
+## @var _EXP_MULT
+#  @brief Scaling factor 10^Exponent for every accepted exponent (-6 to 6).
+_EXP_MULT: Dict[int, float] = {e: 10.0 ** e for e in range(-6, 7)}
+
+# --- PRECOMPILED FRAME LAYOUTS ---
+
+## @var _U16LE
+#  @brief Little Endian 16-bit field (LEN, DEST, SRC, Index).
+_U16LE: struct.Struct = struct.Struct("<H")
+
+## @var _U16BE
+#  @brief Big Endian 16-bit field (CRC).
+_U16BE: struct.Struct = struct.Struct(">H")
+
+## @var _I8
+#  @brief Single signed byte (Exponent).
+_I8: struct.Struct = struct.Struct("<b")
+
+## @var _PACK_HDR
+#  @brief Frame header: [LEN] [DEST] [SRC] [CMD].
+_PACK_HDR: struct.Struct = struct.Struct("<HHHB")
+
+## @var _PACK_REQ
+#  @brief Read request payload: [0x01] [Index].
+_PACK_REQ: struct.Struct = struct.Struct("<BH")
+
+## @var _REQ_FRAME_SIZE
+#  @brief Size of a read request frame: [Start] + Header (7) + Payload (3) + CRC (2) + [Stop].
+_REQ_FRAME_SIZE: int = 14
+
+def _build_crc16_table() -> Tuple[int, ...]:
+    """
+    @brief Precomputes the CRC-16/XMODEM lookup table (Polynomial 0x1021).
+    @details Entry N is the CRC register after shifting byte N through the bitwise algorithm.
+    @return A 256-entry tuple of 16-bit integers.
+    """
+    table = []
+    for b in range(256):
+        crc = b << 8
+        for _ in range(8):
+            if crc & 0x8000: crc = (crc << 1) ^ 0x1021
+            else: crc <<= 1
+            crc &= 0xFFFF
+        table.append(crc)
+    return tuple(table)
+
+## @var _CRC16_XMODEM_TABLE
+#  @brief Byte-indexed lookup table used by the table-driven CRC.
+_CRC16_XMODEM_TABLE: Tuple[int, ...] = _build_crc16_table()
+
+def _crc16_xmodem_py(data: bytes, crc: int) -> int:
+    """
+    @brief Pure Python table-driven CRC-16/XMODEM.
+    @details Fallback with the same signature as binascii.crc_hqx, used when the C implementation is unavailable.
+    @param data The raw byte sequence to verify.
+    @param crc Initial CRC register value.
+    @return The calculated 16-bit CRC integer.
+    """
+    table = _CRC16_XMODEM_TABLE
+    for b in data:
+        crc = table[((crc >> 8) ^ b) & 0xFF] ^ ((crc << 8) & 0xFFFF)
+    return crc
+
+if crc_hqx is None: crc_hqx = _crc16_xmodem_py
+
+## @var _LATIN1_SPACES
+#  @brief Byte values decoding to a whitespace character in Latin-1 (those removed by str.strip()).
+_LATIN1_SPACES: frozenset = frozenset(b for b in range(256) if chr(b).isspace())
+
+def _read_cstring(buf: bytes, pos: int) -> Tuple[str, int]:
+    """
+    @brief Reads a null-terminated Latin-1 string.
+    @param buf The payload.
+    @param pos Offset of the first character.
+    @return Tuple (stripped string, offset following the terminator). Unterminated strings return ("", len(buf)).
+    """
+    end = buf.find(b'\x00', pos)
+    if end == -1: return "", len(buf)
+    if end == pos: return "", end + 1
+    # Latin-1 maps every byte, decoding cannot fail
+    s = buf[pos:end].decode('latin-1')
+    # Most names are not padded: only strip when an edge character is whitespace
+    if buf[pos] in _LATIN1_SPACES or buf[end - 1] in _LATIN1_SPACES: s = s.strip()
+    return s, end + 1
+
 class GazModemBackend:
     """
     @brief Backend logic handler for network communications.
@@ -91,6 +223,12 @@ class GazModemBackend:
         self.running: bool = False
         self.active_devices: Set[int] = set()
 
+        # Preallocated read requests for one scan window. Only Header, Payload and CRC change per request.
+        self._frame_buf: bytearray = bytearray(_REQ_FRAME_SIZE * SCAN_WINDOW)
+        for pos in range(0, len(self._frame_buf), _REQ_FRAME_SIZE):
+            self._frame_buf[pos] = self.START
+            self._frame_buf[pos + _REQ_FRAME_SIZE - 1] = self.STOP
+
     def _log(self, msg: str, progress: Optional[float] = None) -> None:
         """
         @brief Sends a formatted log message to the UI.
@@ -102,18 +240,26 @@ class GazModemBackend:
     def _crc(self, data: bytes) -> int:
         """
         @brief Calculates the CRC-16/XMODEM (Polynomial 0x1021).
+        @details Delegates to binascii.crc_hqx (C implementation of the same CRC).
         @param data The raw byte sequence to verify.
         @return The calculated 16-bit CRC integer.
         """
-        crc = 0x0000
-        poly = 0x1021
-        for b in data:
-            crc ^= (b << 8)
-            for _ in range(8):
-                if crc & 0x8000: crc = (crc << 1) ^ poly
-                else: crc <<= 1
-                crc &= 0xFFFF
-        return crc
+        return crc_hqx(data, 0)
+
+    def _build_request(self, mv: memoryview, pos: int, target: int, idx: int) -> int:
+        """
+        @brief Writes a Read Request (0x02) into the preallocated frame buffer.
+        @details Fills Header, Payload and CRC in place. Start and Stop bytes are set once in __init__.
+        @param mv Writable view of the frame buffer.
+        @param pos Offset of the frame in the buffer.
+        @param target The device address.
+        @param idx Parameter index.
+        @return Offset of the next frame.
+        """
+        _PACK_HDR.pack_into(mv, pos + 1, _PACK_REQ.size + 5, target, MY_SA, 0x02)
+        _PACK_REQ.pack_into(mv, pos + 8, 1, idx)
+        _U16BE.pack_into(mv, pos + 11, crc_hqx(mv[pos + 1 : pos + 11], 0))
+        return pos + _REQ_FRAME_SIZE
 
     def connect(self) -> bool:
         """
@@ -122,6 +268,11 @@ class GazModemBackend:
         """
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Small request frames must leave immediately (Nagle + delayed ACK add up to 40ms)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Buffer sizes must be set before connect() to be applied to the TCP window
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
             self.sock.settimeout(1.0)
             self.sock.connect((self.ip, self.port))
             return True
@@ -129,6 +280,32 @@ class GazModemBackend:
             self._log(f"Connection Error: {e}")
             return False
 
+    def _parse_frames(self, buf: bytearray, off: int, frames: List[Tuple[int, int]]) -> int:
+        """
+        @brief Splits the complete frames out of a receive buffer.
+        @details Bytes preceding a Start Byte are skipped. Parsing stops at the first incomplete frame.
+        @param buf The receive buffer.
+        @param off Read cursor in the buffer.
+        @param frames List receiving the (offset, length) of every complete frame found.
+        @return The updated read cursor.
+        """
+        while len(buf) - off > 8:
+            if buf[off] != self.START:
+                # Jump straight to the next candidate Start Byte
+                off = buf.find(self.START, off)
+                if off < 0: return len(buf)
+                continue
+            # At least 9 bytes are available: the header can always be unpacked
+            l_val = _U16LE.unpack_from(buf, off + 1)[0]
+            if l_val > MAX_FRAME_LEN:
+                # Implausible length: this was not a real Start Byte
+                off += 1; continue
+            tot = 1 + 2 + l_val + 3
+            if len(buf) - off < tot: break
+            frames.append((off, tot))
+            off += tot
+        return off
+
     def start_process(self) -> None:
         """
         @brief Main execution loop of the scanner thread.
@@ -146,39 +323,46 @@ class GazModemBackend:
 
         # --- PHASE 1: SNIFFING ---
         self._log(f"PHASE 1: Network Sniffing ({SNIFF_DURATION}s)...")
-        start_time = time.time()
+        # Loop invariants are bound to locals (LOAD_FAST instead of attribute/global lookups)
+        _time = time.time
+        end_time = _time() + SNIFF_DURATION
+        recv = self.sock.recv
+        log = self._log
+        parse = self._parse_frames
+        unpack = _U16LE.unpack_from
+        add_dev = self.active_devices.add
+        ignored = (65535, MY_SA)
         buf = bytearray()
+        off = 0 # Read cursor: consumed bytes are only discarded on compaction
+        frames: List[Tuple[int, int]] = []
 
-        while time.time() - start_time < SNIFF_DURATION and self.running:
-            remaining = int(SNIFF_DURATION - (time.time() - start_time))
+        now = _time()
+        while now < end_time and self.running:
+            remaining = int(end_time - now)
             # 50% of the progress bar is allocated to sniffing
             prog = ((SNIFF_DURATION - remaining) / SNIFF_DURATION) * 50
-            self._log(f"Listening... {remaining}s remaining", prog)
+            log(f"Listening... {remaining}s remaining", prog)
 
             try:
-                if self.sock:
-                    chunk = self.sock.recv(4096)
-                    if chunk:
-                        buf.extend(chunk)
-                        # Process buffer
-                        while len(buf) > 8:
-                            if buf[0] != self.START:
-                                buf.pop(0); continue
-                            try:
-                                l_val = struct.unpack("<H", buf[1:3])[0]
-                                tot = 1 + 2 + l_val + 3
-                                if len(buf) < tot: break
-
-                                dest = struct.unpack("<H", buf[3:5])[0]
-                                src = struct.unpack("<H", buf[5:7])[0]
-
-                                # Filter addresses
-                                if src not in [65535, MY_SA]: self.active_devices.add(src)
-                                if dest not in [65535, MY_SA]: self.active_devices.add(dest)
-
-                                del buf[:tot]
-                            except: buf.pop(0)
-            except: pass
+                chunk = recv(4096)
+                if chunk:
+                    buf.extend(chunk)
+                    # Process buffer
+                    del frames[:]
+                    off = parse(buf, off, frames)
+                    for pos, _ in frames:
+                        dest = unpack(buf, pos + 3)[0]
+                        src = unpack(buf, pos + 5)[0]
+
+                        # Filter addresses
+                        if src not in ignored: add_dev(src)
+                        if dest not in ignored: add_dev(dest)
+
+                    # Compact the buffer once enough bytes have been consumed
+                    if off > 4096 or off == len(buf):
+                        del buf[:off]; off = 0
+            except (socket.timeout, OSError): pass
+            now = _time()
 
         if not self.running: return
 
@@ -187,11 +371,13 @@ class GazModemBackend:
             self.active_devices = {1, 100}
             self._log("No traffic detected. Forcing scan on IDs 1 and 100.")
         else:
-            self._log(f"Devices detected: {list(self.active_devices)}")
+            self._log(f"Devices detected: {sorted(self.active_devices)}")
 
         # --- PHASE 2: SCANNING ---
-        devs = sorted(list(self.active_devices))
+        devs = sorted(self.active_devices)
         total = len(devs)
+        # Responses are awaited with select(), so reads never have to block
+        if self.sock: self.sock.setblocking(False)
 
         for i, dev in enumerate(devs):
             if not self.running: break
@@ -208,61 +394,81 @@ class GazModemBackend:
         """
         @brief Scans a memory range on a specific device.
         @details Implements logic to skip large empty memory blocks to save time.
+                 Requests are pipelined by windows of SCAN_WINDOW indexes.
         @param target The device address to scan.
         @param start Start index.
         @param end End index.
         """
         empty_streak = 0
+        buf = bytearray()
+        frames: List[Tuple[int, int]] = []
 
-        for idx in range(start, end):
+        for win_start in range(start, end, SCAN_WINDOW):
             if not self.running: break
 
-            # Log every 10 items to avoid spamming the UI queue
-            if idx % 10 == 0:
-                self._log(f"Device {target} : Index {idx}...", None)
-
             if empty_streak >= MAX_EMPTY_STREAK:
                 self._log(f"Device {target} : Empty zone detected. Skipping device.", None)
                 break
 
+            indices = range(win_start, min(win_start + SCAN_WINDOW, end))
+
+            # Log every 10 items to avoid spamming the UI queue
+            for idx in indices:
+                if idx % 10 == 0:
+                    self._log(f"Device {target} : Index {idx}...", None)
+
             time.sleep(0.01) # Throttling
 
             if self.sock:
-                # Flush buffer
-                self.sock.settimeout(0.01)
+                # Flush buffer (non-blocking: returns at once when nothing is pending)
                 try:
                     while self.sock.recv(4096): pass
-                except: pass
-
-                # Build Request: [Start] [Len] [Dest] [Src] [Cmd=0x02] [Data] [CRC] [Stop]
-                req = struct.pack("<BH", 1, idx)
-                l = len(req) + 5
-                h = struct.pack("<HHHB", l, target, MY_SA, 0x02) + req
-                frame = struct.pack("B", self.START) + h + struct.pack(">H", self._crc(h)) + struct.pack("B", self.STOP)
-
-                found = False
+                except OSError: pass # BlockingIOError once drained
+                buf.clear(); off = 0
+
+                # Build Requests: [Start] [Len] [Dest] [Src] [Cmd=0x02] [Data] [CRC] [Stop]
+                mv = memoryview(self._frame_buf)
+                build = self._build_request
+                pos = 0
+                for idx in indices:
+                    pos = build(mv, pos, target, idx)
+
+                pending = set(indices)
+                found: Set[int] = set()
                 try:
-                    self.sock.send(frame)
-                    self.sock.settimeout(0.2)
-                    resp = self.sock.recv(1024)
-
-                    # Parsing
-                    if len(resp) > 8 and self.START in resp:
-                        start_pos = resp.find(self.START)
-                        # Ensure we have enough bytes for header
-                        if start_pos >= 0 and len(resp) > start_pos + 8:
-                            # Strict check: Function Code must be 0x82 (Read Response)
-                            if resp[start_pos+7] == 0x82:
-                                payload = resp[start_pos+8:-3]
+                    self.sock.sendall(mv[:pos])
+                    deadline = time.time() + RESPONSE_TIMEOUT * len(indices)
+                    while pending:
+                        wait = min(RESPONSE_TIMEOUT, deadline - time.time())
+                        if wait <= 0 or not select.select([self.sock], [], [], wait)[0]: break
+                        chunk = self.sock.recv(4096)
+                        if not chunk: break
+                        buf.extend(chunk)
+
+                        # Parsing
+                        del frames[:]
+                        off = self._parse_frames(buf, off, frames)
+                        # The view must be released before buf is resized again
+                        with memoryview(buf) as rv:
+                            for pos, tot in frames:
+                                # Strict check: Function Code must be 0x82 (Read Response)
+                                # and the payload must echo a pending index
+                                if tot < 14 or rv[pos+7] != 0x82: continue
+                                idx = _U16LE.unpack_from(rv, pos + 9)[0]
+                                if idx not in pending: continue
+                                pending.discard(idx)
+
+                                # Single copy of the payload (a bytearray slice would add a second one)
+                                payload = rv[pos+8:pos+tot-3].tobytes()
                                 res = self._decode(target, idx, payload)
                                 if res:
                                     self.result_queue.put(res)
-                                    found = True
-                                    empty_streak = 0
-                except: pass
+                                    found.add(idx)
+                except (OSError, ValueError): pass # ValueError: select() on a closed socket
 
-                if not found:
-                    empty_streak += 1
+                for idx in indices:
+                    if idx in found: empty_streak = 0
+                    else: empty_streak += 1
 
     def _decode(self, addr: int, idx: int, data: bytes) -> Optional[Dict[str, Any]]:
         """
@@ -274,35 +480,27 @@ class GazModemBackend:
         """
         try:
             cursor = 3
-            def read_str(buf: bytes, pos: int) -> Tuple[str, int]:
-                end = buf.find(b'\x00', pos)
-                if end == -1: return "", len(buf)
-                s = buf[pos:end].decode('latin-1', 'ignore').strip()
-                return s, end + 1
-
-            name, cursor = read_str(data, cursor)
-            unit, cursor = read_str(data, cursor)
+            name, cursor = _read_cstring(data, cursor)
+            unit, cursor = _read_cstring(data, cursor)
 
             if not name or name == "?": return None
             if len(data) < cursor + 2: return None
 
             info_raw = data[cursor]
-            exp_raw_byte = bytes([data[cursor+1]])
+            exponent = _I8.unpack_from(data, cursor + 1)[0]
             cursor += 2
 
             type_id = info_raw & 0x0F
             rw_bit = bool(info_raw & 0x20)
 
-            exponent = struct.unpack("<b", exp_raw_byte)[0]
             if abs(exponent) > 6: exponent = 0
 
-            type_name, size, fmt, is_float = TYPE_DEFS.get(type_id, ("UNK", 0, None, False))
+            type_name, size, st, is_float = _TYPE_TABLE[type_id]
 
             val_str = "---"
             if size > 0 and len(data) >= cursor + size:
-                raw_bytes = data[cursor : cursor + size]
-                if fmt:
-                    val = struct.unpack(fmt, raw_bytes)[0]
+                if st:
+                    val = st.unpack_from(data, cursor)[0]
 
                     if is_float:
                         val_str = f"{val:.2f}"
@@ -312,7 +510,7 @@ class GazModemBackend:
                         val_str = "TXT"
                     else:
                         if exponent != 0:
-                            val_str = f"{val * (10 ** exponent):g}"
+                            val_str = f"{val * _EXP_MULT[exponent]:g}"
                         else:
                             val_str = f"{val}"
 
@@ -321,7 +519,7 @@ class GazModemBackend:
                 "val": val_str, "exp": exponent, "unit": unit,
                 "type": type_name, "rw": "RW" if rw_bit else "RO"
             }
-        except: return None
+        except (ValueError, IndexError, struct.error): return None
 
 class AppGUI:
     """
@@ -340,6 +538,9 @@ class AppGUI:
         self.log_queue: queue.Queue = queue.Queue()
         self.result_queue: queue.Queue = queue.Queue()
         self.backend: Optional[GazModemBackend] = None
+        # Table content mirrored in memory, so the export does not query Tk row by row
+        self._rows: List[Tuple[Any, ...]] = []
+        self._scroll_pending: bool = False
         self._setup_ui()
         self._check_queues()
 
@@ -407,6 +608,7 @@ class AppGUI:
         ip = self.ip_ent.get()
         port = self.port_ent.get()
         for i in self.tree.get_children(): self.tree.delete(i)
+        self._rows.clear()
         self.btn_scan.config(state="disabled"); self.btn_stop.config(state="normal")
         self.prog['value'] = 0
         self.backend = GazModemBackend(ip, int(port), self.log_queue, self.result_queue)
@@ -427,30 +629,54 @@ class AppGUI:
             with open(fn, 'w', newline='', encoding='utf-8') as f:
                 w = csv.writer(f, delimiter=';')
                 w.writerow(["Address", "Index", "Name", "Value", "Exponent", "Unit", "Type", "Access"])
-                for i in self.tree.get_children(): w.writerow(self.tree.item(i)['values'])
+                w.writerows(self._rows)
             messagebox.showinfo("Success", "CSV file saved successfully!")
         except Exception as e: messagebox.showerror("Error", str(e))
 
     def _check_queues(self) -> None:
         """@brief Periodically checks for updates from the backend thread."""
+        # Only the latest status of the tick is displayed
+        status, progress, completed = None, None, False
         try:
             while True:
                 t, m, p = self.log_queue.get_nowait()
                 if t == "STATUS":
-                    self.lbl_stat.config(text=m)
-                    if p is not None: self.prog['value'] = p
-                    if m == "SCAN COMPLETED!": self.stop_scan()
+                    status = m
+                    if p is not None: progress = p
+                    if m == "SCAN COMPLETED!": completed = True
         except queue.Empty: pass
+        if status is not None: self.lbl_stat.config(text=status)
+        if progress is not None: self.prog['value'] = progress
+        if completed: self.stop_scan()
 
+        rows = []
         try:
-            while True:
-                r = self.result_queue.get_nowait()
-                tag = "highlight" if ("15.7" in str(r['val']) or "21.2" in str(r['val'])) else ""
-                self.tree.insert("", "end", values=(r['addr'], r['idx'], r['name'], r['val'], r['exp'], r['unit'], r['type'], r['rw']), tags=(tag,))
-                self.tree.yview_moveto(1)
+            for _ in range(UI_BATCH_SIZE):
+                rows.append(self.result_queue.get_nowait())
         except queue.Empty: pass
+
+        if rows:
+            ins = self.tree.insert
+            keep = self._rows.append
+            n1, n2 = _HIGHLIGHT_NEEDLES
+            for r in rows:
+                v = r['val'] # Already a string (see GazModemBackend._decode)
+                tags = _TAGS_HI if (n1 in v or n2 in v) else _TAGS_NO
+                row = (r['addr'], r['idx'], r['name'], v, r['exp'], r['unit'], r['type'], r['rw'])
+                ins("", "end", values=row, tags=tags)
+                keep(row)
+            self.tree.update_idletasks()
+            # Scroll to the last row at most every 500ms
+            if not self._scroll_pending:
+                self._scroll_pending = True
+                self.root.after(500, self._scroll_to_end)
         self.root.after(100, self._check_queues)
 
+    def _scroll_to_end(self) -> None:
+        """@brief Scrolls the table to the last row (throttled by _check_queues)."""
+        self._scroll_pending = False
+        self.tree.yview_moveto(1)
+
 if __name__ == "__main__":
     root = tk.Tk()
     AppGUI(root)